@@ -7,6 +7,7 @@
 import argparse
 from collections import defaultdict
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, timedelta
 import os
@@ -36,6 +37,10 @@ from utils.dates import merge_dateranges
 from xdg_dirs import getXDGdirectories
 
 
+# Each parser may run its own pdftotext process while it is created.
+MAX_PARSER_THREADS = min(4, os.cpu_count() or 1)
+
+
 @dataclass
 class IncomingStatement:
     statement_path: Path
@@ -46,31 +51,46 @@ class IncomingStatement:
 def get_metadata_of_incoming_statements(incoming_dir: Path,
                                         ) -> list[IncomingStatement]:
     incoming_statements = []
-    for bankpath in sorted(incoming_dir.iterdir()):
-        if not bankpath.is_dir():
-            continue
-        bank = bankpath.name
-        bank_parsers = parsers.get(bank)
-        if bank_parsers is None:
-            print('unknown bank:', bank, file=sys.stderr)
-            continue
-        filenames = sorted(bankpath.iterdir())
-        if filenames:
-            print('importing bank statements from', bank)
-        for src_file in filenames:
-            try:
-                extension = src_file.suffix.lower()
-                Parser = bank_parsers[extension]
-            except KeyError:
+    # Parsers convert their input file (e.g. by running pdftotext) when
+    # they are created, so create them concurrently.
+    with ThreadPoolExecutor(max_workers=MAX_PARSER_THREADS) as executor:
+        incoming_parsers: dict[str, list[tuple[Path, Future[Parser]]]] = {}
+        for bankpath in sorted(incoming_dir.iterdir()):
+            if not bankpath.is_dir():
+                continue
+            bank = bankpath.name
+            bank_parsers = parsers.get(bank)
+            if bank_parsers is None:
+                print('unknown bank:', bank, file=sys.stderr)
                 continue
-            parser = Parser(src_file)
-            m = parser.parse_metadata()
-            print(f'{m.start_date} → {m.end_date}: {src_file}')
-            incoming_statements.append(IncomingStatement(
-                statement_path=src_file,
-                parser=parser,
-                metadata=m,
-                ))
+            filenames = sorted(bankpath.iterdir())
+            if not filenames:
+                continue
+            bank_files = incoming_parsers[bank] = []
+            for src_file in filenames:
+                try:
+                    extension = src_file.suffix.lower()
+                    parser_class = bank_parsers[extension]
+                except KeyError:
+                    continue
+                bank_files.append((src_file,
+                                   executor.submit(parser_class, src_file)))
+        for bank, bank_files in incoming_parsers.items():
+            print('importing bank statements from', bank)
+            for src_file, parser_future in bank_files:
+                try:
+                    parser = parser_future.result()
+                    m = parser.parse_metadata()
+                    print(f'{m.start_date} → {m.end_date}: {src_file}')
+                    incoming_statements.append(IncomingStatement(
+                        statement_path=src_file,
+                        parser=parser,
+                        metadata=m,
+                        ))
+                except (Exception, KeyboardInterrupt):
+                    # Don't keep converting the remaining statements.
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
     return incoming_statements
 
 
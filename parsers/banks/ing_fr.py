@@ -5,6 +5,7 @@
 from collections.abc import Iterator
 from datetime import date
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
 import re
 from typing import Optional
@@ -66,6 +67,14 @@ class IngFrPdfParser(OldPdfParser[IngFrConfig]):
                                r'^( *)Nouveau solde au (\d{2}\/\d{2}\/\d{4})'
                                r'\s*(\d[ \d]*,\d\d)',
                                flags=re.MULTILINE)
+    old_balance_pattern = re.compile(
+            r'^\s*Ancien solde au (\d{2}\/\d{2}\/\d{4})\s*(\d[ \d]*,\d\d)',
+            flags=re.MULTILINE)
+    transaction_block_start_pattern = re.compile(r'^ {30} *(\S.+)\n',
+                                                 flags=re.MULTILINE)
+    transaction_block_end_pattern = re.compile(
+            r'^ *Sous total (.+?)\s+(\d[ \d]*,\d\d)\s*(\d[ \d]*,\d\d)\n',
+            flags=re.MULTILINE)
 
     def parse_column_starts(self) -> tuple[int, int]:
         m = self.table_heading.search(self.pdf_pages[0])
@@ -153,10 +162,7 @@ class IngFrPdfParser(OldPdfParser[IngFrConfig]):
         self.parse_total_and_new_balance()
 
     def parse_old_balance(self) -> None:
-        m = re.compile(
-                r'^\s*Ancien solde au (\d{2}\/\d{2}\/\d{4})\s*(\d[ \d]*,\d\d)',
-                flags=re.MULTILINE) \
-              .search(self.transactions_text)
+        m = self.old_balance_pattern.search(self.transactions_text)
         assert m is not None, 'Old balance not found.'
         old_balance = parse_amount(m.group(2))
         if m.end(2) - m.start() < self.credit_start:
@@ -165,7 +171,10 @@ class IngFrPdfParser(OldPdfParser[IngFrConfig]):
         self.transactions_start = m.end()
 
     def parse_total_and_new_balance(self) -> None:
-        m = self.total_pattern.search(self.transactions_text)
+        # The totals follow the transactions, so there's no need to search
+        # the text before the old balance again.
+        m = self.total_pattern.search(self.transactions_text,
+                                      self.transactions_start)
         assert m is not None, 'New balance not found.'
         if m.group(2):
             total_debit = parse_amount(m.group(1))
@@ -199,24 +208,18 @@ class IngFrPdfParser(OldPdfParser[IngFrConfig]):
                                              start: int, end: int,
                                              account: str,
                                              ) -> Iterator[Transaction]:
-        transaction_block_start_pattern = re.compile(
-                r'^ {30} *(\S.+)\n',
-                flags=re.MULTILINE)
-        transaction_block_end_pattern = re.compile(
-                r'^ *Sous total (.+?)\s+(\d[ \d]*,\d\d)\s*(\d[ \d]*,\d\d)\n',
-                flags=re.MULTILINE)
         accumulated_sub_totals = [Decimal('0.00'), Decimal('0.00')]
         while True:
-            m = transaction_block_start_pattern.search(self.transactions_text,
-                                                       start, end)
+            m = self.transaction_block_start_pattern.search(
+                    self.transactions_text, start, end)
             if m is None:
                 assert accumulated_sub_totals[0] == self.total_debit
                 assert accumulated_sub_totals[1] == self.total_credit
                 return
             block_start = m.end()
             transaction_type = m.group(1)
-            m = transaction_block_end_pattern.search(self.transactions_text,
-                                                     block_start, end)
+            m = self.transaction_block_end_pattern.search(
+                    self.transactions_text, block_start, end)
             assert m is not None, 'End of transaction block not found.'
             block_end = m.start()
             assert m.group(1) == transaction_type
@@ -266,7 +269,8 @@ class IngFrPdfParser(OldPdfParser[IngFrConfig]):
             if m is None:
                 return
             transaction_date = parse_date(m.group(1))
-            value_date = parse_date(m.group(2)) if m.group(2) != '' else None
+            value_date_str = m.group(2)
+            value_date = parse_date(value_date_str) if value_date_str else None
             description_lines = [m.group(3)]
             m = self.amount_pattern.search(self.transactions_text,
                                            start+self.debit_start, end)
@@ -308,6 +312,7 @@ class IngFrQifParser(QifParser[IngFrConfig]):
         return parse_date(input_)
 
 
+@lru_cache(maxsize=4096)
 def parse_date(d: str) -> date:
     """ parse a date in "dd/mm/yyyy" format """
     day = int(d[:2])
@@ -246,7 +246,7 @@ class CleaningParser(Parser[CCT], metaclass=ABCMeta):
     def parse(self, config: CCT) -> BankStatement:
         statement = self.parse_raw(config.accounts)
         cleaner = config.cleaner.with_builtin_rules(self.cleaning_rules)
-        transactions = [cleaner.clean(t) for t in statement.transactions]
+        transactions = list(map(cleaner.clean, statement.transactions))
         config.mapper.map_transactions(transactions)
         statement.transactions = transactions
         return statement
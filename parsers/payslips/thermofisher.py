@@ -3,15 +3,17 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from __future__ import annotations
+from collections import defaultdict, deque
 from collections.abc import Callable
 import configparser
 from dataclasses import dataclass
 from datetime import date, timedelta
 from decimal import Decimal
-from itertools import chain, groupby
+from functools import lru_cache
+import io
 from pathlib import Path
 import re
-from typing import cast, Final, Optional, TypeVar
+from typing import cast, ClassVar, Final, Optional, TypeVar
 
 from ..parser import (
     BaseParserConfig,
@@ -24,7 +26,6 @@ from ..parser import (
 from ..pdf_parser import read_pdf_file
 from bank_statement import BankStatement, BankStatementMetadata
 from transaction import MultiTransaction, Posting
-from utils import PeekableIterator
 from utils.dates import end_of_month
 from utils.languages.nl import MONTHS
 
@@ -220,6 +221,11 @@ class ThermoFisherWorkdayConfig(BaseParserConfig):
         # payments
         '9721': 'assets:receivable:salary:correction',  # Correctie TWK Bank 1
     }
+    DEFAULT_CODE_ACCOUNTS: Final[dict[int, str]] = {
+        int(key): account
+        for key, account in DEFAULT_ACCOUNTS.items()
+        if key.isnumeric()
+    }
     salary_balancing_account: str
     accounts: dict[int, str]
 
@@ -233,11 +239,7 @@ class ThermoFisherWorkdayConfig(BaseParserConfig):
         return cls(
             salary_balancing_account
                 = cls.DEFAULT_ACCOUNTS['salary balancing account'],
-            accounts={
-                int(key): account
-                for key, account in cls.DEFAULT_ACCOUNTS.items()
-                if key.isnumeric()
-            },
+            accounts=dict(cls.DEFAULT_CODE_ACCOUNTS),
         )
 
     @classmethod
@@ -300,6 +302,7 @@ class ThermoFisherWorkdayConfig(BaseParserConfig):
 
 class ThermoFisherPdfParser(Parser[ThermoFisherConfig]):
     file_extension = '.pdf'
+    ADP_PATTERN: Final = re.compile(r' *1PAYSLNL\d+ ')
 
     def __init__(self, pdf_file: Path):
         super().__init__(pdf_file)
@@ -309,7 +312,7 @@ class ThermoFisherPdfParser(Parser[ThermoFisherConfig]):
     def _choose_parser(self) -> tuple[Parser,
                                       Callable[[ThermoFisherConfig],
                                                BankStatement]]:
-        m = re.match(r' *1PAYSLNL\d+ ', self.pdf_pages[0])
+        m = self.ADP_PATTERN.match(self.pdf_pages[0])
         if m is not None:
             adp_parser = ThermoFisherAdpPdfParser(self.pdf_pages)
             def parse_adp(config: ThermoFisherConfig) -> BankStatement:
@@ -338,6 +341,15 @@ class ThermoFisherAdpPdfParser(Parser[ThermoFisherAdpConfig]):
     """
     autoload = False
     file_extension = '.pdf'
+    FIRST_LINE_PATTERN: Final = re.compile(
+            r' *\d+PAYSLNL\d+'
+            r' (?P<gv_employee_id>\d+?)'
+            r'(?P<month>\d\d)\/(?P<short_year>\d\d)(?P<num>\d+)'
+            r' +(?P<month_name>[A-Z][a-z]+) (?P<year>\d+)'
+            r' +Pagina +: +(?P<page>\d+)\n')
+    GV_PERSONEELSNR_PATTERN: Final = re.compile(r'\n( +)GV personeelsnr')
+    # Addresses are separated by at least one empty line.
+    ADDRESS_SEPARATOR: Final = re.compile(r'\n{2,}')
 
     def __init__(self, pdf_pages: list[str]):
         self.pdf_pages = pdf_pages
@@ -353,17 +365,13 @@ class ThermoFisherAdpPdfParser(Parser[ThermoFisherAdpConfig]):
             return self._metadata
         page1 = self.pdf_pages[0]
         # parse first line
-        m = re.match(r' *\d+PAYSLNL\d+'
-                     r' (?P<gv_employee_id>\d+?)'
-                     r'(?P<month>\d\d)\/(?P<short_year>\d\d)(?P<num>\d+)'
-                     r' +(?P<month_name>[A-Z][a-z]+) (?P<year>\d+)'
-                     r' +Pagina +: +(?P<page>\d+)\n', page1)
+        m = self.FIRST_LINE_PATTERN.match(page1)
         if m is None:
             raise ThermoFisherPdfParserError(
                     'Could not parse first line of payslip.')
         first_line = m.groupdict()
         meta_start = m.end() + 1
-        m = re.search(r'\n( +)GV personeelsnr', page1)
+        m = self.GV_PERSONEELSNR_PATTERN.search(page1)
         if m is None:
             raise ThermoFisherPdfParserError(
                     'Could not find first metadata line.')
@@ -371,40 +379,21 @@ class ThermoFisherAdpPdfParser(Parser[ThermoFisherAdpConfig]):
         main_table_header_start = self.main_table.main_table_start
 
         left_col = []
-        right_col = []
+        right_column: dict[str, str] = {}
         for line in page1[meta_start:main_table_header_start-1].split('\n'):
             left_col.append(line[0:right_table_offset].strip())
-            right_col.append(line[right_table_offset:])
+            right = line[right_table_offset:]
+            if right:
+                key, colon, value = right.partition(':')
+                right_column[key.rstrip()] = value.lstrip()
 
-        addresses = []
-        current_address: list[str] = []
-        num_empty = 0
-        for line in left_col:
-            if not line:
-                num_empty += 1
-                continue
-            if num_empty >= 1 and current_address:
-                addresses.append('\n'.join(current_address))
-                current_address = []
-            num_empty = 0
-            current_address.append(line)
-        if current_address:
-            addresses.append('\n'.join(current_address))
+        addresses = split_addresses(left_col, self.ADDRESS_SEPARATOR)
         if not len(addresses) == 2:
             raise ThermoFisherPdfParserError(
                     f'Expected 2 addresses, but found {len(addresses)}:\n'
                     + '\n======\n'.join(addresses)
                     + '\n======\nRaw address column:\n'
                     + '\n'.join(left_col))
-        employer_address = addresses[0]
-        employee_address = addresses[1]
-
-        right_column: dict[str, str] = {}
-        for line in right_col:
-            if not line:
-                continue
-            key, colon, value = line.partition(':')
-            right_column[key.rstrip()] = value.lstrip()
 
         start_date = date(year=int(first_line['year']),
                           month=int(first_line['month']),
@@ -436,6 +425,7 @@ class ThermoFisherAdpPdfParser(Parser[ThermoFisherAdpConfig]):
         voorschotten: Decimal | None = None
         sum_unmarked = Decimal(0)
         sum_marked = Decimal(0)
+        postings: list[Posting] = []
         unknown_codes: list[AdpMainTableItem] = []
         for item in self.main_table:
             assert item.code is not None
@@ -446,7 +436,7 @@ class ThermoFisherAdpPdfParser(Parser[ThermoFisherAdpConfig]):
                 assert nettoloon is not None
                 nettoloon_difference \
                         = (nettoloon
-                           + sum(p.amount for p in transaction.postings))
+                           + sum(p.amount for p in postings))
                 if nettoloon_difference != 0:
                     unknown = (
                         '' if not unknown_codes
@@ -456,7 +446,7 @@ class ThermoFisherAdpPdfParser(Parser[ThermoFisherAdpConfig]):
                                          for item in unknown_codes))
                     raise ThermoFisherPdfParserError(
                             f'Nettoloon {nettoloon} does not match postings:\n'
-                            + '\n'.join(str(p) for p in transaction.postings)
+                            + '\n'.join(str(p) for p in postings)
                             + '\nDifference of nettoloon is'
                             + f' {nettoloon_difference}{unknown}')
                 assert sum_unmarked + sum_marked == nettoloon
@@ -472,9 +462,8 @@ class ThermoFisherAdpPdfParser(Parser[ThermoFisherAdpConfig]):
                 continue
             if item.code == '/404':  # Basis LH
                 continue  # ignore
-            try:
-                account = accounts[item.code]
-            except KeyError:
+            account = accounts.get(item.code)
+            if account is None:
                 unknown_codes.append(item)
                 continue
             if item.uitbetaling is not None:
@@ -498,7 +487,7 @@ class ThermoFisherAdpPdfParser(Parser[ThermoFisherAdpConfig]):
                 comment += f', date:{posting_date}'
             p = Posting(account, amount,
                         comment=comment)
-            transaction.add_posting(p)
+            postings.append(p)
         if unknown_codes:
             raise ThermoFisherPdfParserError(
                     f'Encountered {len(unknown_codes)} unknown code(s):\n'
@@ -508,7 +497,8 @@ class ThermoFisherAdpPdfParser(Parser[ThermoFisherAdpConfig]):
         assert net_payment == self.main_table.payment
         assert nettoloon is not None
         assert sum_marked + sum_unmarked \
-                == -sum(p.amount for p in transaction.postings)
+                == -sum(p.amount for p in postings)
+        transaction.add_postings(postings)
         if voorschotten is not None:
             assert sum_marked + sum_unmarked - voorschotten == net_payment
             transaction.add_posting(
@@ -522,40 +512,42 @@ class ThermoFisherAdpPdfParser(Parser[ThermoFisherAdpConfig]):
 
 
 class AdpMainTable:
-    HEADER: Final[str] = (
+    HEADER: Final = re.compile(
             r'^ +(Basis *) (Tarief *) (Tabelloon *) (Bijz.loon *)'
-            r' (Uitbetaling)$')
+            r' (Uitbetaling)$',
+            flags=re.MULTILINE)
+    SALARIS_PATTERN: Final = re.compile(r'^[ \*]?1110 +(Salaris)',
+                                        flags=re.MULTILINE)
+    PAYMENT_PATTERN: Final = re.compile(
+            r'^ *Uitbetalingsbedrag +([\d\.]+,\d\d)$',
+            flags=re.MULTILINE)
 
     def __init__(self, page: str):
         self.pdf_page = page
-        m = re.search(self.HEADER, page, flags=re.MULTILINE)
+        m = self.HEADER.search(page)
         if m is None:
             raise ThermoFisherPdfParserError(
                     'Could not find main table header.')
         self.main_table_start = m.start()
         self.main_table_body_start = m.end() + 1
         assert m.lastindex is not None
-        m2 = re.compile(r'^[ \*]?1110 +(Salaris)',
-                        flags=re.MULTILINE,
-                        ).search(page, pos=self.main_table_body_start)
+        m2 = self.SALARIS_PATTERN.search(page, pos=self.main_table_body_start)
         if m2 is None:
             raise ThermoFisherPdfParserError(
                     'Could not find Salaris in main table.')
-        self.main_table_spans = {
-            'Code': slice(0, m2.start(1) - m2.start()),
-            'Omschrijving': slice(m2.start(1) - m2.start(),
-                                  m.start(1) - m.start()),
-        }
-        for i in range(1, m.lastindex):
-            self.main_table_spans[m.group(i).strip()] = slice(
-                m.start(i) - m.start(),
-                m.end(i) - m.start(),
-            )
-        self.main_table_spans[m.group(m.lastindex).strip()] = slice(
-                m.start(m.lastindex) - m.start(), None)
+        line_start = m.start()
+        # Column slices in the order of the AdpMainTableItem fields:
+        # Code, Omschrijving, Basis, Tarief, Tabelloon, Bijz.loon and
+        # Uitbetaling, which extends to the end of the line.
+        self.column_slices: tuple[slice, ...] = (
+            slice(0, m2.start(1) - m2.start()),
+            slice(m2.start(1) - m2.start(), m.start(1) - line_start),
+            *(slice(m.start(i) - line_start, m.end(i) - line_start)
+              for i in range(1, m.lastindex)),
+            slice(m.start(m.lastindex) - line_start, None),
+        )
 
-        m = re.search(r'^ *Uitbetalingsbedrag +([\d\.]+,\d\d)$', page,
-                      flags=re.MULTILINE)
+        m = self.PAYMENT_PATTERN.search(page)
         if m is None:
             raise ThermoFisherPdfParserError('Could not find payment.')
         self.payment = Decimal(m.group(1).replace('.', '').replace(',', '.'))
@@ -564,32 +556,33 @@ class AdpMainTable:
     def __iter__(self) -> AdpMainTableIterator:
         return AdpMainTableIterator(
                 self.pdf_page[self.main_table_body_start:self.main_table_end],
-                self.main_table_spans,
+                self.column_slices,
                 )
 
 
 class AdpMainTableIterator:
     def __init__(self,
                  table_text: str,
-                 spans: dict[str, slice],
+                 column_slices: tuple[slice, ...],
                  ):
-        self._spans = spans
-        self._lines = iter(table_text.split('\n'))
+        self._slices = column_slices
+        self._uitbetaling_slice = column_slices[-1]
+        self._lines = io.StringIO(table_text)
 
     def __iter__(self) -> AdpMainTableIterator:
         return self
 
     def __next__(self) -> AdpMainTableItem:
-        line = next(self._lines)
+        line = next(self._lines).rstrip('\n')
+        # Skip empty lines and the separator lines above subtotals.
         while (not line
-               or line[self._spans['Uitbetaling']].strip() == '-----------'):
-            line = next(self._lines)
-        parts = {key.lower(): line[span].strip()
-                 for key, span in self._spans.items()}
-        return AdpMainTableItem.from_dict(parts)
+               or line[self._uitbetaling_slice].strip() == '-----------'):
+            line = next(self._lines).rstrip('\n')
+        return AdpMainTableItem.from_positions(
+                *(line[s].strip() for s in self._slices))
 
 
-@dataclass
+@dataclass(slots=True)
 class AdpMainTableItem:
     star_marker: bool
     code: str
@@ -601,28 +594,29 @@ class AdpMainTableItem:
     uitbetaling: Decimal | None
 
     @classmethod
-    def from_dict(cls, d: dict[str, str]) -> AdpMainTableItem:
-        def decimal(value: str) -> Decimal:
-            value = value.replace('.', '').replace(',', '.')
-            if value.endswith('-'):
-                value = '-' + value[:-1]
-            return Decimal(value)
-
-        assert not d['basis']
-        assert not d['tarief']
-        code = d['code']
+    def from_positions(cls,
+                       code: str,
+                       omschrijving: str,
+                       basis: str,
+                       tarief: str,
+                       tabelloon: str,
+                       bijz_loon: str,
+                       uitbetaling: str,
+                       ) -> AdpMainTableItem:
+        assert not basis
+        assert not tarief
         prefix = code.startswith('*')
         if prefix:
             code = code[1:]
         res = cls(
             star_marker=prefix,
             code=code,
-            omschrijving=d['omschrijving'],
+            omschrijving=omschrijving,
             basis=None,
             tarief=None,
-            tabelloon=parse_optional(d['tabelloon'], decimal),
-            bijz_loon=parse_optional(d['bijz.loon'], decimal),
-            uitbetaling=parse_optional(d['uitbetaling'], decimal),
+            tabelloon=parse_optional(tabelloon, parse_adp_decimal),
+            bijz_loon=parse_optional(bijz_loon, parse_adp_decimal),
+            uitbetaling=parse_optional(uitbetaling, parse_adp_decimal),
         )
         assert (
             res.tabelloon is None and res.bijz_loon is None
@@ -632,6 +626,14 @@ class AdpMainTableItem:
         return res
 
 
+def parse_adp_decimal(value: str) -> Decimal:
+    # Dutch number format with trailing minus sign, e.g. 1.234,56-
+    value = value.replace('.', '').replace(',', '.')
+    if value.endswith('-'):
+        value = '-' + value[:-1]
+    return Decimal(value)
+
+
 class ThermoFisherWorkdayPdfParser(Parser[ThermoFisherWorkdayConfig]):
     """Parser for Workday payslips.
 
@@ -641,6 +643,14 @@ class ThermoFisherWorkdayPdfParser(Parser[ThermoFisherWorkdayConfig]):
     """
     autoload = False
     file_extension = '.pdf'
+    PERSNR_PATTERN: Final = re.compile(
+            r'^ +(Persnr) +\d+ +(Bedrijfsnr\/Werknr) +\d+-\d+$',
+            flags=re.MULTILINE)
+    # Split address field if at least 6 empty lines.
+    # (Sometimes pdftotext creates empty lines in an address, but
+    #  fortunately there are more blank lines as separation between
+    #  addresses.)
+    ADDRESS_SEPARATOR: Final = re.compile(r'\n{7,}')
 
     def __init__(self, pdf_pages: list[str]):
         self.pdf_pages = pdf_pages
@@ -676,7 +686,7 @@ class ThermoFisherWorkdayPdfParser(Parser[ThermoFisherWorkdayConfig]):
                 assert metadata[i].end_date == metadata[i+1].end_date
             start_date = min(bs.start_date for bs in metadata)
             end_date = max(bs.end_date for bs in metadata)
-            return BankStatementMetadata(
+            self._metadata = BankStatementMetadata(
                 start_date=start_date,
                 end_date=end_date,
                 employee_number=metadata[0].employee_number,
@@ -685,7 +695,8 @@ class ThermoFisherWorkdayPdfParser(Parser[ThermoFisherWorkdayConfig]):
                 is_recalculation=True,
             )
         else:
-            return self.parse_metadata_of_page(0)
+            self._metadata = self.get_metadata_of_page(0)
+        return self._metadata
 
     def get_metadata_of_page(self, page_nr: int) -> BankStatementMetadata:
         return self._metadata_per_page[page_nr]
@@ -693,9 +704,7 @@ class ThermoFisherWorkdayPdfParser(Parser[ThermoFisherWorkdayConfig]):
     def parse_metadata_of_page(self, page_nr: int) -> BankStatementMetadata:
         page = self.pdf_pages[page_nr]
         tables = self.tables[page_nr]
-        m = re.search(r'^ +(Persnr) +\d+ +(Bedrijfsnr\/Werknr) +\d+-\d+$',
-                      page,
-                      flags=re.MULTILINE)
+        m = self.PERSNR_PATTERN.search(page)
         if m is None:
             raise ThermoFisherPdfParserError(
                     'Could not find first line of metadata table.')
@@ -709,32 +718,13 @@ class ThermoFisherWorkdayPdfParser(Parser[ThermoFisherWorkdayConfig]):
             address_col.append(line[0:left_table_offset].strip())
             left_col.append(line[left_table_offset:right_table_offset].rstrip())
             right_col.append(line[right_table_offset:])
-        # Split address field if at least 6 empty lines.
-        # (Sometimes pdftotext creates empty lines in an address, but
-        #  fortunately there are more blank lines as separation between
-        #  addresses.)
-        addresses = []
-        current_address: list[str] = []
-        num_empty = 0
-        for line in address_col:
-            if not line:
-                num_empty += 1
-                continue
-            if num_empty > 5 and current_address:
-                addresses.append('\n'.join(current_address))
-                current_address = []
-            num_empty = 0
-            current_address.append(line)
-        if current_address:
-            addresses.append('\n'.join(current_address))
+        addresses = split_addresses(address_col, self.ADDRESS_SEPARATOR)
         if not (2 <= len(addresses) <= 3):
             raise RuntimeError(
                     f'Expected 2 or 3 addresses, but found {len(addresses)}:\n'
                     + '\n======\n'.join(addresses)
                     + '\n======\nRaw address column:\n'
                     + '\n'.join(address_col))
-        employer_address = addresses[0]
-        employee_address = addresses[1]
         if len(addresses) > 2:
             description = addresses[-1]
         else:
@@ -749,19 +739,19 @@ class ThermoFisherWorkdayPdfParser(Parser[ThermoFisherWorkdayConfig]):
                     'No working hours found in metadata table.')
         meta = {'working_hours': '\n'.join(working_hours)}
         empty_fields = []
-        for line in chain(left_col, right_col):
-            if not line:
-                continue
-            m = re.match(r'(.*?)  +(.*)', line)
-            if m is None:
-                empty_fields.append(line)
-                continue
-            meta[m.group(1)] = m.group(2)
+        for col in (left_col, right_col):
+            for line in col:
+                if not line:
+                    continue
+                key, sep, value = line.partition('  ')
+                if not sep:
+                    empty_fields.append(line)
+                    continue
+                meta[key] = value.lstrip(' ')
         if meta.get('') == 'Afgeboekt':
             del meta['']
             meta['Herberekening'] = 'Afgeboekt'
-        if re.match(r'\s*Herberekening\n', page,
-                    flags=re.MULTILINE) is not None:
+        if tables.is_recalculation:
             meta['Herberekening'] = 'Herberekening'
             assert meta[''] == 'Herberekening'
             del meta['']
@@ -788,9 +778,8 @@ class ThermoFisherWorkdayPdfParser(Parser[ThermoFisherWorkdayConfig]):
     def _parse_corrections(self,
                            config: ThermoFisherWorkdayConfig) -> BankStatement:
         correction_account = config.accounts[9721]
-        statements = []
-        for page in range(len(self.pdf_pages)):
-            statements.append(self.parse_page(page, config))
+        statements = [self.parse_page(page, config)
+                      for page in range(len(self.pdf_pages))]
         assert all(len(s.transactions) == 1 for s in statements)
         assert len(statements) == len(self._metadata_per_page)
         transactions = []
@@ -803,14 +792,27 @@ class ThermoFisherWorkdayPdfParser(Parser[ThermoFisherWorkdayConfig]):
             transaction = MultiTransaction(description, old.transaction_date)
             # TODO: This assumes that types of postings in new are
             #       a superset of old's postings.
-            new_postings = iter(new.postings)
+            new_postings = new.postings
+            positions: defaultdict[tuple[Optional[str], Optional[str]],
+                                   deque[int]] = defaultdict(deque)
+            for j, p in enumerate(new_postings):
+                positions[(p.account, p.comment)].append(j)
+            next_new = 0
             for old_posting in old.postings:
-                new_posting = next(new_postings)
-                while (old_posting.account != new_posting.account
-                       or old_posting.comment != new_posting.comment):
-                    # Take new lines in new posting as-is.
+                candidates = positions[(old_posting.account,
+                                        old_posting.comment)]
+                while candidates and candidates[0] < next_new:
+                    candidates.popleft()
+                if not candidates:
+                    raise ThermoFisherPdfParserError(
+                            f'Could not find {old_posting} in recalculated'
+                            ' payslip.')
+                j = candidates.popleft()
+                # Take new lines in new posting as-is.
+                for new_posting in new_postings[next_new:j]:
                     transaction.add_posting(new_posting)
-                    new_posting = next(new_postings)
+                new_posting = new_postings[j]
+                next_new = j + 1
                 if new_posting.amount == old_posting.amount:
                     # skip identical postings
                     continue
@@ -847,6 +849,7 @@ class ThermoFisherWorkdayPdfParser(Parser[ThermoFisherWorkdayConfig]):
                           config: ThermoFisherWorkdayConfig) -> Decimal:
         accounts = config.accounts
         net_total: Optional[Decimal] = None
+        postings: list[Posting] = []
         unknown_codes: list[WorkdayMainTableItem] = []
         for item in self.tables[page].main_table:
             if item.is_total():
@@ -855,9 +858,8 @@ class ThermoFisherWorkdayPdfParser(Parser[ThermoFisherWorkdayConfig]):
                 net_total = item.uitbetaling
                 continue
             assert item.code is not None
-            try:
-                account = accounts[item.code]
-            except KeyError:
+            account = accounts.get(item.code)
+            if account is None:
                 unknown_codes.append(item)
                 continue
             if item.tabel is not None:
@@ -871,56 +873,86 @@ class ThermoFisherWorkdayPdfParser(Parser[ThermoFisherWorkdayConfig]):
                         f'Missing amount in {item}.')
             p = Posting(account, amount,
                         comment=item.omschrijving)
-            transaction.add_posting(p)
+            postings.append(p)
         if unknown_codes:
             raise RuntimeError(
                     f'Encountered {len(unknown_codes)} unknown code(s):\n'
                     + '\n'.join(f'  {item.code}: {item.omschrijving}'
                                 for item in unknown_codes))
         assert net_total is not None
+        transaction.add_postings(postings)
         return net_total
 
     def _parse_payment_table(self,
                              page: int,
                              transaction: MultiTransaction,
                              config: ThermoFisherWorkdayConfig) -> Decimal:
-        payment_total = Decimal('0.00')
+        postings: list[Posting] = []
+        amounts: list[Decimal] = []
         for item in self.tables[page].payment_table:
             description = ' '.join(item.description.split())
             p = Posting(config.salary_balancing_account,
                         item.amount,
                         comment=description)
-            transaction.add_posting(p)
-            payment_total += item.amount
-        return payment_total
+            postings.append(p)
+            amounts.append(item.amount)
+        transaction.add_postings(postings)
+        return sum(amounts, start=Decimal('0.00'))
+
+
+def split_addresses(column: list[str],
+                    separator: re.Pattern[str]) -> list[str]:
+    """Split a column of stripped lines into addresses.
+
+    Addresses are separated by runs of empty lines matching `separator`.
+    Empty lines within an address are dropped.
+    """
+    text = '\n'.join(column).strip('\n')
+    if not text:
+        return []
+    return ['\n'.join(filter(None, address.split('\n')))
+            for address in separator.split(text)]
 
 
+def parse_workday_decimal(value: str) -> Decimal:
+    # Dutch decimal comma without thousands separators, e.g. 1234,56
+    return Decimal(value.replace(',', '.'))
+
+
+@lru_cache(maxsize=4096)
 def parse_date(d: str) -> date:
     # Dutch inverse ISO format
     day, month, year = d.split('-')
     return date(int(year), int(month), int(day))
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkdayPayslipTables:
     main_table: WorkdayMainTable
     payment_table: WorkdayPaymentTable
     totals_table: str
+    is_recalculation: bool
+
+    HERBEREKENING_PATTERN: ClassVar = re.compile(r'\s*Herberekening\n',
+                                                 flags=re.MULTILINE)
+    TOTALS_PATTERN: ClassVar = re.compile(r'^ *TOTALEN T\/M DEZE PERIODE',
+                                          flags=re.MULTILINE)
+    RESULTAAT_PATTERN: ClassVar = re.compile(
+            r'^Resultaat +\d+,\d\d +Afboeking strook:',
+            flags=re.MULTILINE)
 
     @classmethod
     def create(cls, pdf_pages: list[str], page_nr: int) -> WorkdayPayslipTables:
         page = pdf_pages[page_nr]
         main_table = WorkdayMainTable(page)
-        m = re.match(r'\s*Herberekening\n', page, flags=re.MULTILINE)
+        m = cls.HERBEREKENING_PATTERN.match(page)
         is_recalculation = m is not None
-        m = re.search(r'^ *TOTALEN T\/M DEZE PERIODE', page,
-                      flags=re.MULTILINE)
+        m = cls.TOTALS_PATTERN.search(page)
         if m is None:
             raise ThermoFisherPdfParserError('Could not find totals table.')
         totals_table = page[m.start():]
         if is_recalculation:
-            m = re.search(r'^Resultaat +\d+,\d\d +Afboeking strook:', page,
-                          flags=re.MULTILINE)
+            m = cls.RESULTAAT_PATTERN.search(page)
             if m is None:
                 raise ThermoFisherPdfParserError('Could not find Resultaat.')
         main_table_end = m.start() - 1
@@ -932,18 +964,21 @@ class WorkdayPayslipTables:
             main_table=main_table,
             payment_table=payment_table,
             totals_table=totals_table,
+            is_recalculation=is_recalculation,
         )
 
 
 class WorkdayMainTable:
-    HEADER: Final[str] = (
-        r'(Code) +(Omschrijving +)(Aantal) +(Eenheid) +(Waarde) +'
-        r'(Uitbetaling)( +Inhouding )( +Tabel)( +BT)( +WnV +)(Cumulatief)'
+    HEADER: Final = re.compile(
+        r'^(Code) +(Omschrijving +)(Aantal) +(Eenheid) +(Waarde) +'
+        r'(Uitbetaling)( +Inhouding )( +Tabel)( +BT)( +WnV +)(Cumulatief)',
+        flags=re.MULTILINE,
         )
+    BETALING_PATTERN: Final = re.compile(r'^ *Betaling$', flags=re.MULTILINE)
 
     def __init__(self, page: str):
         self.pdf_page = page
-        m = re.search(self.HEADER, page)
+        m = self._find_header(page)
         if m is None:
             raise ThermoFisherPdfParserError(
                     'Could not find main table header.')
@@ -954,41 +989,57 @@ class WorkdayMainTable:
                 m.group(i).strip(): slice(m.start(i) - m.start(),
                                           m.end(i) - m.start())
                 for i in range(1, m.lastindex + 1)}
+        # Column slices in the order of the WorkdayMainTableItem fields.
+        self.column_slices = tuple(self.main_table_spans.values())
 
-        m = re.search(r'^ *Betaling$', page,
-                      flags=re.MULTILINE)
+        # The payment table follows the main table, so only search after
+        # the main table header.
+        m = self.BETALING_PATTERN.search(page, self.main_table_body_start)
         if m is None:
             raise ThermoFisherPdfParserError('Could not find payment table.')
         self.betaling_start = m.start()
 
+    @classmethod
+    def _find_header(cls, page: str) -> Optional[re.Match[str]]:
+        # Only try to match the header where a 'Code' column title occurs
+        # instead of letting the regex attempt a match at every position.
+        start = page.find('Code')
+        while start != -1:
+            m = cls.HEADER.match(page, start)
+            if m is not None:
+                return m
+            start = page.find('Code', start + 1)
+        return None
+
     def __iter__(self) -> WorkdayMainTableIterator:
         return WorkdayMainTableIterator(
                 self.pdf_page[self.main_table_body_start:self.betaling_start-1],
-                self.main_table_spans,
+                self.column_slices,
                 )
 
 
 class WorkdayMainTableIterator:
     def __init__(self,
                  table_text: str,
-                 spans: dict[str, slice],
+                 column_slices: tuple[slice, ...],
                  ):
-        self._spans = spans
-        self._lines = iter(table_text.split('\n'))
+        self._slices = column_slices
+        self._lines = io.StringIO(table_text)
 
     def __iter__(self) -> WorkdayMainTableIterator:
         return self
 
     def __next__(self) -> WorkdayMainTableItem:
-        line = next(self._lines)
+        # Strip trailing whitespace (including the newline) once per line,
+        # so that the spans of empty trailing columns slice an empty string.
+        line = next(self._lines).rstrip()
         while not line:
-            line = next(self._lines)
-        parts = {key.lower(): line[span].strip()
-                 for key, span in self._spans.items()}
-        return WorkdayMainTableItem.from_dict(parts)
+            line = next(self._lines).rstrip()
+        return WorkdayMainTableItem.from_positions(
+                *(line[s].strip() for s in self._slices))
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkdayMainTableItem:
     code: Optional[int]
     omschrijving: str
@@ -1003,28 +1054,36 @@ class WorkdayMainTableItem:
     cumulatief: Optional[Decimal]
 
     @classmethod
-    def from_dict(cls, d: dict[str, str]) -> WorkdayMainTableItem:
-        def decimal(value):
-            return Decimal(value.replace(',', '.'))
-
+    def from_positions(cls,
+                       code: str,
+                       omschrijving: str,
+                       aantal: str,
+                       eenheid: str,
+                       waarde: str,
+                       uitbetaling: str,
+                       inhouding: str,
+                       tabel: str,
+                       bt: str,
+                       wnv: str,
+                       cumulatief: str,
+                       ) -> WorkdayMainTableItem:
         try:
-            code = parse_optional(d['code'], int)
-            omschrijving = d['omschrijving']
+            parsed_code = parse_optional(code, int)
         except ValueError:
-            code = None
-            omschrijving = d['code'] + d['omschrijving']
+            parsed_code = None
+            omschrijving = code + omschrijving
         return cls(
-                code=code,
+                code=parsed_code,
                 omschrijving=omschrijving,
-                aantal=parse_optional(d['aantal'], decimal),
-                eenheid=d['eenheid'],
-                waarde=parse_optional(d['aantal'], decimal),
-                uitbetaling=parse_optional(d['uitbetaling'], decimal),
-                inhouding=parse_optional(d['inhouding'], decimal),
-                tabel=parse_optional(d['tabel'], decimal),
-                bt=parse_optional(d['bt'], decimal),
-                wnv=parse_optional(d['wnv'], decimal),
-                cumulatief=parse_optional(d['cumulatief'], decimal),
+                aantal=parse_optional(aantal, parse_workday_decimal),
+                eenheid=eenheid,
+                waarde=parse_optional(waarde, parse_workday_decimal),
+                uitbetaling=parse_optional(uitbetaling, parse_workday_decimal),
+                inhouding=parse_optional(inhouding, parse_workday_decimal),
+                tabel=parse_optional(tabel, parse_workday_decimal),
+                bt=parse_optional(bt, parse_workday_decimal),
+                wnv=parse_optional(wnv, parse_workday_decimal),
+                cumulatief=parse_optional(cumulatief, parse_workday_decimal),
                 )
 
     def is_total(self) -> bool:
@@ -1048,34 +1107,44 @@ class WorkdayPaymentTableIterator:
                  table_text: str,
                  spans: dict[str, slice],
                  ):
-        self._spans = spans
-        self._lines = PeekableIterator[str](table_text.split('\n'))
+        self._code_span = spans['Code']
+        self._uitbetaling_span = spans['Uitbetaling']
+        self._description_span = slice(self._code_span.stop,
+                                       self._uitbetaling_span.start)
+        self._lines = table_text.split('\n')
+        self._index = 0
 
     def __iter__(self) -> WorkdayPaymentTableIterator:
         return self
 
     def __next__(self) -> WorkdayPaymentTableItem:
-        line = next(self._lines)
-        while not line:
-            line = next(self._lines)
-        code_span = self._spans['Code']
+        lines = self._lines
+        num_lines = len(lines)
+        i = self._index
+        while i < num_lines and not lines[i]:
+            i += 1
+        if i == num_lines:
+            self._index = i
+            raise StopIteration
+        line = lines[i]
+        i += 1
+        code_span = self._code_span
+        description_span = self._description_span
         code = int(line[code_span].strip())
-        uit_span = self._spans['Uitbetaling']
-        uitbetaling = Decimal(line[uit_span].strip().replace(',', '.'))
-        description = line[code_span.stop:uit_span.start].strip()
-        try:
-            next_line = self._lines.peek()
-            if next_line and not next_line[code_span].strip():
-                line = next(self._lines)
-                description += line[code_span.stop:uit_span.start].strip()
-        except StopIteration:
-            pass
+        uitbetaling = Decimal(line[self._uitbetaling_span].strip()
+                              .replace(',', '.'))
+        description = line[description_span].strip()
+        if i < num_lines and lines[i] and not lines[i][code_span].strip():
+            # Continuation of the description on the next line.
+            description += lines[i][description_span].strip()
+            i += 1
+        self._index = i
         return WorkdayPaymentTableItem(code=code,
                                        description=description,
                                        amount=uitbetaling)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkdayPaymentTableItem:
     code: int
     description: str
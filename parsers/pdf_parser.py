@@ -16,6 +16,9 @@ from .parser import BaseCleaningParserConfig, CleaningParser
 from transaction import BaseTransaction, Balance, MultiTransaction, Transaction
 
 
+PDFTOTEXT_CHUNK_SIZE = 64 * 1024
+
+
 def read_pdf_file(pdf_file: Path, *, cols: Optional[int] = None) -> list[str]:
     """Read PDF file.
 
@@ -32,12 +35,31 @@ def read_pdf_file(pdf_file: Path, *, cols: Optional[int] = None) -> list[str]:
         formatting = ['-fixed', str(cols)]
     else:
         formatting = ['-layout']
+    pdf_pages: list[str] = []
     # pdftotext is provided by poppler-utils on Debian
-    pdftext = subprocess.run(['pdftotext', *formatting, str(pdf_file), '-'],
-                             capture_output=True, encoding='UTF8',
-                             check=True).stdout
-    # Careful: There's a trailing \f on the last page
-    pdf_pages = pdftext.split('\f')[:-1]
+    # stderr is only read after stdout, but pdftotext writes at most a few
+    # lines of error messages, which easily fit into the pipe's buffer.
+    with subprocess.Popen(['pdftotext', *formatting, str(pdf_file), '-'],
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          encoding='UTF8') as pdftotext:
+        assert pdftotext.stdout is not None
+        assert pdftotext.stderr is not None
+        # Collect the pieces of the current page and join them only once
+        # the page is finished.
+        page_parts: list[str] = []
+        while chunk := pdftotext.stdout.read(PDFTOTEXT_CHUNK_SIZE):
+            # Careful: There's a trailing \f on the last page,
+            # so that the unfinished page is empty in the end.
+            first, *finished_pages = chunk.split('\f')
+            page_parts.append(first)
+            if finished_pages:
+                pdf_pages.append(''.join(page_parts))
+                page_parts = [finished_pages.pop()]
+                pdf_pages.extend(finished_pages)
+        stderr = pdftotext.stderr.read()
+    if pdftotext.returncode != 0:
+        raise subprocess.CalledProcessError(pdftotext.returncode,
+                                            pdftotext.args, stderr=stderr)
     return pdf_pages
 
 
@@ -84,10 +106,9 @@ class OldPdfParser(PdfParser[CT]):
     def parse_raw(self, accounts: dict[str, str]) -> BankStatement:
         self.transactions_text = self.extract_transactions_table()
         self.parse_balances()
-        transactions = [t for t in self.generate_transactions(
-                                            self.transactions_start,
-                                            self.transactions_end,
-                                            accounts)]
+        transactions = list(self.generate_transactions(self.transactions_start,
+                                                       self.transactions_end,
+                                                       accounts))
         return BankStatement(transactions, self.old_balance, self.new_balance)
 
     @abstractmethod
@@ -95,7 +116,8 @@ class OldPdfParser(PdfParser[CT]):
         pass
 
     def extract_transactions_table(self) -> str:
-        return ''.join(self.extract_table_from_page(p) for p in self.pdf_pages)
+        return ''.join([self.extract_table_from_page(p)
+                        for p in self.pdf_pages])
 
     @abstractmethod
     def extract_table_from_page(self, page: str) -> str: pass
@@ -3,10 +3,11 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from abc import ABCMeta, abstractmethod
+from collections.abc import Iterable
 from datetime import date
 from decimal import Decimal
 from pathlib import Path
-from typing import Optional, TextIO, TypeVar
+from typing import Optional, TypeVar
 
 from bank_statement import BankStatement, BankStatementMetadata
 from .parser import BaseCleaningParserConfig, CleaningParser
@@ -39,21 +40,27 @@ class QifParser(CleaningParser[CT], metaclass=ABCMeta):
             header = f.readline()
             if not header == '!Type:Bank\n':
                 raise RuntimeError(f'Unknown QIF account type: {header}')
-            transactions = self._parse_transactions(f, accounts)
+            # Split on newlines only, like iterating over the file would;
+            # splitlines() would also break lines at e.g. \x0c or \x85.
+            lines = f.read().split('\n')
+        if lines[-1] == '':
+            # Drop the empty string after the final newline.
+            lines.pop()
+        transactions = self._parse_transactions(lines, accounts)
         return BankStatement(transactions=transactions)
 
-    def _parse_transactions(self, file_: TextIO,
+    def _parse_transactions(self, lines: Iterable[str],
                             accounts: dict[str, str]) -> list[Transaction]:
         account = accounts[self.account_type]
         transactions = []
-        while line := file_.readline():
-            type_, rest = line[0], line[1:]
+        for line in lines:
+            type_, rest = line[:1], line[1:]
             if type_ == 'D':
                 date = self.parse_date(rest)
             elif type_ == 'T':
                 amount = Decimal(rest)
             elif type_ == 'P':
-                description = rest.removesuffix('\n')
+                description = rest
             elif type_ == '^':
                 transactions.append(Transaction(
                     account=account,
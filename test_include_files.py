@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from collections.abc import Iterable
+import os
 from pathlib import Path
 from typing import TypeAlias
 
@@ -54,24 +55,25 @@ def check_include_content(base_dir: Path) -> bool:
     journal_file: Path | None = None
     directories: list[str] = []
     files: list[str] = []
-    for p in base_dir.iterdir():
-        if p.name == 'journal.hledger':
-            journal_file = p
-        elif p.is_dir():
-            if check_include_content(p):
-                directories.append(
-                        str(p.relative_to(base_dir) / 'journal.hledger'))
-        elif p.suffix == '.hledger':
-            files.append(p.name)
+    # os.scandir() gets the file types from the directory listing, so
+    # is_dir() doesn't need to stat() each entry.
+    with os.scandir(base_dir) as entries:
+        for entry in entries:
+            if entry.name == 'journal.hledger':
+                journal_file = Path(entry.path)
+            elif entry.is_dir():
+                if check_include_content(Path(entry.path)):
+                    directories.append(
+                            str(Path(entry.name) / 'journal.hledger'))
+            elif entry.name.endswith('.hledger'):
+                files.append(entry.name)
     if journal_file is None:
         return False
     directories.sort()
     files.sort()
-    includes = []
-    with journal_file.open() as f:
-        for line in f:
-            if line.startswith('include '):
-                includes.append(line[len('include '):].rstrip())
+    includes = [line[len('include '):].rstrip()
+                for line in journal_file.read_text().split('\n')
+                if line.startswith('include ')]
     assert directories + files == includes
     return True
 
@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: 2024 Felix Gruber <felgru@posteo.net>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from copy import copy
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from transaction import MultiTransaction, Posting, Transaction
+
+
+def create_test_transaction() -> Transaction:
+    return Transaction(account='assets:bank',
+                       description='Test',
+                       transaction_date=date(2024, 1, 1),
+                       value_date=None,
+                       amount=Decimal('-10.00'))
+
+
+def test_change_properties() -> None:
+    t = create_test_transaction()
+    t2 = t.change_property(('description', 'external_account'),
+                           lambda t: ('Cleaned', 'expenses:test'))
+    assert t2.description == 'Cleaned'
+    assert t2.external_account == 'expenses:test'
+    assert t.description == 'Test'
+    assert t.external_account is None
+
+
+def test_change_const_property_raises_error() -> None:
+    t = create_test_transaction()
+    with pytest.raises(RuntimeError):
+        t.change_property('amount', lambda t: Decimal('10.00'))
+    with pytest.raises(RuntimeError):
+        t.change_property(('description', 'amount'),
+                          lambda t: ('Cleaned', Decimal('10.00')))
+
+
+def test_copy_keeps_subclass() -> None:
+    class SubTransaction(Transaction):
+        __slots__ = ()
+
+    t = SubTransaction(account='assets:bank',
+                       description='Test',
+                       transaction_date=date(2024, 1, 1),
+                       value_date=None,
+                       amount=Decimal('-10.00'),
+                       metadata={'type': 'CB'})
+    t2 = copy(t)
+    assert type(t2) is SubTransaction
+    t2.metadata['type'] = 'VIR'
+    assert t.metadata == {'type': 'CB'}
+
+
+def test_copy_multi_transaction() -> None:
+    class SubMultiTransaction(MultiTransaction):
+        __slots__ = ()
+
+    t = SubMultiTransaction(description='Test',
+                            transaction_date=date(2024, 1, 1),
+                            metadata={'type': 'CB'})
+    t.add_posting(Posting('assets:bank', Decimal('-10.00')))
+    t2 = copy(t)
+    assert type(t2) is SubMultiTransaction
+    t2.add_posting(Posting('expenses:test', Decimal('10.00')))
+    t2.metadata['type'] = 'VIR'
+    assert len(t.postings) == 1
+    assert t.metadata == {'type': 'CB'}
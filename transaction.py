@@ -6,12 +6,13 @@ from __future__ import annotations
 from abc import ABCMeta, abstractmethod
 from collections.abc import Callable, Iterable
 from copy import copy
-from collections import defaultdict
 from datetime import date
 from decimal import Decimal
-from typing import Any, NamedTuple, Optional, TypeVar, Union
+from typing import Any, Final, NamedTuple, Optional, TypeVar, Union
 
 class BaseTransaction(metaclass=ABCMeta):
+    __slots__ = ()
+
     description: str
     transaction_date: date
     metadata: dict[str, Any]
@@ -37,6 +38,12 @@ class BaseTransaction(metaclass=ABCMeta):
                                  .format(self.__class__.__name__))
 
 class Transaction(BaseTransaction):
+    __slots__ = ('account', 'description', 'transaction_date', 'value_date',
+                 'external_value_date', 'amount', 'currency',
+                 'external_account', 'metadata')
+
+    CONST_PROPERTIES: Final = frozenset({'amount', 'currency', 'sub_total'})
+
     def __init__(self, account: str, description: str,
                  transaction_date: date, value_date: Optional[date],
                  amount: Decimal, currency: str = '€',
@@ -55,22 +62,31 @@ class Transaction(BaseTransaction):
             metadata = {}
         self.metadata = metadata
 
+    def __copy__(self) -> Transaction:
+        # Much faster than copy's generic __reduce_ex__ based copying.
+        # The metadata is copied, so that changing it doesn't affect the
+        # original transaction.
+        return type(self)(self.account, self.description,
+                          self.transaction_date, self.value_date,
+                          self.amount, self.currency,
+                          self.external_account, self.external_value_date,
+                          dict(self.metadata))
+
     # TODO: Overload to handle different types of f
     def change_property(self,
                         prop: Union[str, Iterable[str]],
                         f: Callable[[BaseTransaction], Any],
                         ) -> Transaction:
         res = copy(self)
-        const_properties = ('amount', 'currency', 'sub_total')
         if isinstance(prop, str):
-            if prop in const_properties:
+            if prop in self.CONST_PROPERTIES:
                 raise RuntimeError(f'Cannot change {prop} of a transaction')
             setattr(res, prop, f(self))
         else:
             new_vals = f(self)
             for p, v in zip(prop, new_vals):
-                if prop in const_properties:
-                    raise RuntimeError(f'Cannot change {prop} of a transaction')
+                if p in self.CONST_PROPERTIES:
+                    raise RuntimeError(f'Cannot change {p} of a transaction')
                 setattr(res, p, v)
         return res
 
@@ -96,7 +112,7 @@ class Transaction(BaseTransaction):
         result = f'{t.transaction_date} {t.description}{comment}\n'
         block_comment = t.metadata.get('block_comment')
         if block_comment is not None:
-            block_comment = '\n    ; '.join(block_comment.split('\n'))
+            block_comment = block_comment.replace('\n', '\n    ; ')
             result += '    ; ' + block_comment + '\n'
         if t.value_date is not None and t.value_date != t.transaction_date:
             value_date = f' ; date:{t.value_date}'
@@ -133,6 +149,8 @@ class Transaction(BaseTransaction):
                 f'{ext_account}{ext_date}{meta})')
 
 class MultiTransaction(BaseTransaction):
+    __slots__ = ('description', 'transaction_date', 'postings', 'metadata')
+
     def __init__(self, description: str, transaction_date: date,
                  postings: Optional[list[Posting]] = None,
                  metadata: Optional[dict[str, Any]] = None):
@@ -146,9 +164,16 @@ class MultiTransaction(BaseTransaction):
             metadata = {}
         self.metadata = metadata
 
+    def __copy__(self) -> MultiTransaction:
+        return type(self)(self.description, self.transaction_date,
+                          list(self.postings), dict(self.metadata))
+
     def add_posting(self, posting: Posting) -> None:
         self.postings.append(posting)
 
+    def add_postings(self, postings: Iterable[Posting]) -> None:
+        self.postings.extend(postings)
+
     # TODO: Overload to handle different types of f
     def change_property(self,
                         prop: Union[str, Iterable[str]],
@@ -172,7 +197,7 @@ class MultiTransaction(BaseTransaction):
         result = f'{t.transaction_date} {t.description}{comment}\n'
         block_comment = t.metadata.get('block_comment')
         if block_comment is not None:
-            block_comment = '\n    ; '.join(block_comment.split('\n'))
+            block_comment = block_comment.replace('\n', '\n    ; ')
             result += '    ; ' + block_comment + '\n'
         result += ''.join(p.format_as_ledger_transaction(t.transaction_date)
                           for p in t.postings)
@@ -180,12 +205,15 @@ class MultiTransaction(BaseTransaction):
 
     def is_balanced(self) -> bool:
         without_amount = 0
-        amounts: defaultdict[str, Decimal] = defaultdict(lambda: Decimal(0))
+        amounts: dict[str, Decimal] = {}
         for p in self.postings:
             if p.amount is None:
                 without_amount += 1
+                if without_amount > 1:
+                    # At most one posting may have its amount inferred.
+                    return False
                 continue
-            amounts[p.currency] += p.amount
+            amounts[p.currency] = amounts.get(p.currency, 0) + p.amount
         unbalanced_currencies = sum(1 for a in amounts.values() if a != 0)
         return (unbalanced_currencies == 0 and without_amount == 0) \
                or (unbalanced_currencies <= 1 and without_amount == 1)
@@ -200,6 +228,9 @@ class MultiTransaction(BaseTransaction):
                 f' {s.postings!r}{meta})')
 
 class Posting:
+    __slots__ = ('account', 'amount', 'currency', 'date', 'comment',
+                 'conversion_price')
+
     def __init__(self, account: Optional[str], amount: Decimal,
                  currency: str = '€', posting_date: Optional[date] = None,
                  comment: Optional[str] = None, *,
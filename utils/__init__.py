@@ -3,37 +3,33 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from collections.abc import Iterable, Iterator
-from typing import TypeVar
+from typing import cast, Final, TypeVar, Union
 
 
 T = TypeVar('T')
 
+# Marks that the underlying iterator of a PeekableIterator is exhausted.
+_END: Final = object()
+
 
 class PeekableIterator(Iterator[T]):
+    __slots__ = ('_iter', '_next')
+
     def __init__(self, iterable: Iterable[T]):
         self._iter = iter(iterable)
-        self._end = False
-        self._advance()
+        self._next: Union[T, object] = next(self._iter, _END)
 
     def __next__(self) -> T:
-        if self._end:
+        next_ = self._next
+        if next_ is _END:
             raise StopIteration()
-        else:
-            next_ = self._next
-            self._advance()
-            return next_
+        self._next = next(self._iter, _END)
+        return cast(T, next_)
 
     def peek(self) -> T:
-        if self._end:
+        if self._next is _END:
             raise StopIteration()
-        else:
-            return self._next
-
-    def _advance(self) -> None:
-        try:
-            self._next = next(self._iter)
-        except StopIteration:
-            self._end = True
+        return cast(T, self._next)
 
 
 class UserError(RuntimeError):
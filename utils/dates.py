@@ -3,28 +3,34 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from datetime import date, timedelta
+from functools import lru_cache
 
 
 def merge_dateranges(dateranges: list[tuple[date, date]]) -> None:
-    dateranges.sort(key=lambda t: t[0])
-    for i in reversed(range(len(dateranges)-1)):
-        if 0 <= (dateranges[i+1][0] - dateranges[i][1]).days <= 1:
-            dateranges[i] = (dateranges[i][0], dateranges[i+1][1])
-            dateranges.pop(i+1)
-        elif dateranges[i+1] == dateranges[i]:
-            dateranges.pop(i+1)
+    dateranges.sort()
+    merged: list[tuple[date, date]] = []
+    for start, end in dateranges:
+        if merged and (start - merged[-1][1]).days <= 1:
+            # Overlapping or adjacent to the previous date range.
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    dateranges[:] = merged
 
 
+HALF_A_YEAR = timedelta(days=178)
+
+
+@lru_cache(maxsize=4096)
 def parse_date_relative_to(d: str, ref_d: date) -> date:
     try:
         day = int(d[:2])
         month = int(d[3:5])
         year = ref_d.year
         dd = date(year, month, day)
-        half_a_year = timedelta(days=356/2)
         diff = dd - ref_d
-        if abs(diff) > half_a_year:
-            if diff < timedelta(days=0):
+        if abs(diff) > HALF_A_YEAR:
+            if dd < ref_d:
                 dd = date(year + 1, month, day)
             else:
                 dd = date(year - 1, month, day)
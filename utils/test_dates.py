@@ -41,3 +41,11 @@ def test_dont_merge_seperated_dateranges() -> None:
     merge_dateranges(dateranges)
     assert dateranges == [(date(2022, 12, 1), date(2022, 12, 14)),
                           (date(2022, 12, 16), date(2022, 12, 31))]
+
+
+def test_merge_contained_dateranges() -> None:
+    dateranges = [(date(2022, 12, 1), date(2022, 12, 31)),
+                  (date(2022, 12, 5), date(2022, 12, 20)),
+                  (date(2023, 1, 1), date(2023, 1, 31))]
+    merge_dateranges(dateranges)
+    assert dateranges == [(date(2022, 12, 1), date(2023, 1, 31))]